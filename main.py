@@ -1,15 +1,65 @@
 from fastapi import FastAPI, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict, Optional
-from uuid import UUID, uuid4
+from typing import List, Dict, ItemsView, Optional, Tuple
+from uuid import UUID
 from datetime import datetime
+from dataclasses import dataclass
+import os
+import time
 
 app = FastAPI(title="OOP TODO CRUD API")
 
 # Спраочники (хешмпаки) как БД
-user_DB: Dict[UUID, 'User'] = {}
-project_DB: Dict[UUID, 'Project'] = {}
-task_DB: Dict[UUID, 'Task'] = {}
+# Ключи - UUID.int: хеш обычного int дешевле, чем UUID.__hash__, а UUID остаётся только на границе API
+user_DB: Dict[int, '_UserRow'] = {}
+project_DB: Dict[int, '_ProjectRow'] = {}
+task_DB: Dict[int, '_TaskRow'] = {}
+
+# Вторичные индексы для поиска по уникальным полям без перебора user_DB
+username_index: Dict[str, int] = {}
+email_index: Dict[str, int] = {}  # ключ - email.lower(), email сравниваем без учёта регистра
+
+# Обратные индексы связей, чтобы не сканировать project_DB / task_DB при подсчётах
+# Dict[int, None] вместо set: упорядоченное множество, списки отдаются в порядке создания
+projects_by_owner: Dict[int, Dict[int, None]] = {}
+tasks_by_project: Dict[int, Dict[int, None]] = {}
+tasks_by_assignee: Dict[int, Dict[int, None]] = {}
+# Задачи проекта, разбитые по completed, для фильтра ?completed= и completed_tasks_count
+open_tasks_by_project: Dict[int, Dict[int, None]] = {}
+done_tasks_by_project: Dict[int, Dict[int, None]] = {}
+
+# Готовые ответы для GET, сбрасываются репозиториями при изменениях
+# Храним python-словари: UUID и datetime сериализует orjson
+user_response_cache: Dict[int, dict] = {}
+project_response_cache: Dict[int, dict] = {}
+
+
+def _k(u: UUID) -> int:
+    return u.int
+
+
+# UUIDv7 (RFC 9562): старшие 48 бит - unix-время в мс, следующие 12 бит (rand_a) - счётчик
+# внутри миллисекунды (§6.2, метод 1). Время не откатывается назад, поэтому id строго
+# возрастают в порядке создания
+_uuid7_last_ms = 0
+_uuid7_counter = 0
+
+def uuid7() -> UUID:
+    global _uuid7_last_ms, _uuid7_counter
+    ms = time.time_ns() // 1_000_000
+    if ms > _uuid7_last_ms:
+        _uuid7_last_ms = ms
+        # старший бит счётчика 0 - запас на переполнение
+        _uuid7_counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+    else:
+        _uuid7_counter += 1
+        if _uuid7_counter > 0xFFF:
+            _uuid7_last_ms += 1
+            _uuid7_counter = 0
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    value = (_uuid7_last_ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | _uuid7_counter << 64 | 0x2 << 62 | rand_b
+    return UUID(int=value)
 
 
 
@@ -19,7 +69,7 @@ class UserCreateDTO(BaseModel):
     email: str
 
 class User(UserCreateDTO):
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=uuid7)
     created_at: datetime = Field(default_factory=datetime.now)
 
 class UserResponseDTO(User):
@@ -39,7 +89,7 @@ class TaskCreateDTO(BaseModel):
     due_date: Optional[datetime] = None
 
 class Task(TaskCreateDTO):
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=uuid7)
     completed: bool = False
     created_at: datetime = Field(default_factory=datetime.now)
 
@@ -68,7 +118,7 @@ class ProjectCreateDTO(BaseModel):
     owner_id: UUID
 
 class Project(ProjectCreateDTO):
-    id: UUID = Field(default_factory=uuid4)
+    id: UUID = Field(default_factory=uuid7)
     created_at: datetime = Field(default_factory=datetime.now)
 
 class ProjectResponseDTO(Project):
@@ -80,43 +130,90 @@ class ProjectResponseDTO(Project):
 
 
 
+# --------- Строки хранилища ---------
+# В БД лежат slots-датаклассы вместо pydantic-моделей: меньше памяти на запись и быстрый доступ к полям.
+# Pydantic остаётся на границе API: репозитории собирают строку прямо из провалидированного *CreateDTO.
+# Порядок полей совпадает с моделями выше
+
+@dataclass(slots=True)
+class _UserRow:
+    username: str
+    email: str
+    id: UUID
+    created_at: datetime
+
+@dataclass(slots=True)
+class _TaskRow:
+    title: str
+    description: Optional[str]
+    project_id: UUID
+    assignee_id: Optional[UUID]
+    due_date: Optional[datetime]
+    id: UUID
+    completed: bool
+    created_at: datetime
+
+@dataclass(slots=True)
+class _ProjectRow:
+    name: str
+    description: Optional[str]
+    owner_id: UUID
+    id: UUID
+    created_at: datetime
+
+def _row_dict(row) -> dict:
+    return {name: getattr(row, name) for name in row.__slots__}
+
+# --------- Строки хранилища ---------
+
+
+
 # Репозитории
 # --------- UserRepository ---------
 class UserRepository:
 
     @staticmethod
-    def get_by_username(username: str) -> Optional[User]:
-        for user in user_DB.values():
-            if user.username == username:
-                return user
-        return None
+    def get_by_username(username: str) -> Optional[_UserRow]:
+        return user_DB.get(username_index.get(username))
     
     @staticmethod
-    def get_by_email(email: str) -> Optional[User]:
-        for user in user_DB.values():
-            if user.email == email:
-                return user
-        return None
+    def get_by_email(email: str) -> Optional[_UserRow]:
+        return user_DB.get(email_index.get(email.lower()))
 
     @staticmethod
-    def get_all() -> List[User]:
+    def get_all() -> List[_UserRow]:
         return list(user_DB.values())
     
     @staticmethod
-    def get_by_id(user_id: UUID) -> Optional[User]:
-        return user_DB.get(user_id)
+    def items() -> ItemsView[int, _UserRow]:
+        return user_DB.items()
     
     @staticmethod
-    def create(user: User) -> User:
-        user_DB[user.id] = user
-        return user
+    def get_by_id(user_id: UUID) -> Optional[_UserRow]:
+        return user_DB.get(_k(user_id))
+    
+    @staticmethod
+    def create(user_data: UserCreateDTO) -> _UserRow:
+        row = _UserRow(**user_data.__dict__, id=uuid7(), created_at=datetime.now())
+        key = _k(row.id)
+        user_DB[key] = row
+        username_index[row.username] = key
+        email_index[row.email.lower()] = key
+        return row
     
     @staticmethod
     def delete(user_id: UUID) -> bool:
-        if user_id in user_DB:
-            del user_DB[user_id]
-            return True
-        return False
+        key = _k(user_id)
+        # pop вместо `in` + `del`: одна проба хеш-таблицы, атомарно под GIL
+        user = user_DB.pop(key, None)
+        if user is None:
+            return False
+        username_index.pop(user.username, None)
+        email_index.pop(user.email.lower(), None)
+        user_response_cache.pop(key, None)
+        for project_key in projects_by_owner.get(key, ()):
+            project_response_cache.pop(project_key, None)
+        return True
     
 # --------- UserRepository ---------
 
@@ -125,26 +222,40 @@ class UserRepository:
 # --------- ProjectRepository ---------
 class ProjectRepository:
     @staticmethod
-    def get_all() -> List[Project]:
+    def get_all() -> List[_ProjectRow]:
         return list(project_DB.values())
     
     @staticmethod
-    def get_by_id(project_id: UUID) -> Optional[Project]:
-        return project_DB.get(project_id)
+    def items() -> ItemsView[int, _ProjectRow]:
+        return project_DB.items()
+    
+    @staticmethod
+    def get_by_id(project_id: UUID) -> Optional[_ProjectRow]:
+        return project_DB.get(_k(project_id))
     
     @staticmethod
-    def create(project: Project) -> Project:
-        if project.owner_id not in user_DB:
+    def create(project_data: ProjectCreateDTO) -> _ProjectRow:
+        owner_key = _k(project_data.owner_id)
+        if owner_key not in user_DB:
             raise ValueError("Owner does not exist")
-        project_DB[project.id] = project
-        return project
+        row = _ProjectRow(**project_data.__dict__, id=uuid7(), created_at=datetime.now())
+        key = _k(row.id)
+        project_DB[key] = row
+        projects_by_owner.setdefault(owner_key, {})[key] = None
+        user_response_cache.pop(owner_key, None)
+        return row
     
     @staticmethod
     def delete(project_id: UUID) -> bool:
-        if project_id in project_DB:
-            del project_DB[project_id]
-            return True
-        return False
+        key = _k(project_id)
+        project = project_DB.pop(key, None)
+        if project is None:
+            return False
+        owner_key = _k(project.owner_id)
+        projects_by_owner.get(owner_key, {}).pop(key, None)
+        project_response_cache.pop(key, None)
+        user_response_cache.pop(owner_key, None)
+        return True
     
 # --------- ProjectRepository ---------
 
@@ -153,39 +264,98 @@ class ProjectRepository:
 # --------- TaskRepository ---------
 class TaskRepository:
     @staticmethod
-    def get_all() -> List[Task]:
+    def get_all() -> List[_TaskRow]:
         return list(task_DB.values())
     
     @staticmethod
-    def get_by_id(task_id: UUID) -> Optional[Task]:
-        return task_DB.get(task_id)
+    def get_by_id(task_id: UUID) -> Optional[_TaskRow]:
+        return task_DB.get(_k(task_id))
+    
+    @staticmethod
+    def get_by_project(project_id: UUID, completed: Optional[bool] = None) -> List[_TaskRow]:
+        key = _k(project_id)
+        if completed is None:
+            return [task_DB[tid] for tid in tasks_by_project.get(key, ())]
+        # При смене completed задача переезжает в конец другого раздела, поэтому сортируем:
+        # ключи - uuid7, их порядок совпадает с порядком создания
+        partition = done_tasks_by_project if completed else open_tasks_by_project
+        return [task_DB[tid] for tid in sorted(partition.get(key, ()))]
     
     @staticmethod
-    def create(task: Task) -> Task:
-        if task.project_id not in project_DB:
+    def create(task_data: TaskCreateDTO) -> _TaskRow:
+        project_key = _k(task_data.project_id)
+        if project_key not in project_DB:
             raise ValueError("Project does not exist")
-        if task.assignee_id and task.assignee_id not in user_DB:
+        assignee_key = _k(task_data.assignee_id) if task_data.assignee_id else None
+        if assignee_key is not None and assignee_key not in user_DB:
             raise ValueError("Assignee does not exist")
-        task_DB[task.id] = task
-        return task
+        row = _TaskRow(**task_data.__dict__, id=uuid7(), completed=False, created_at=datetime.now())
+        key = _k(row.id)
+        task_DB[key] = row
+        tasks_by_project.setdefault(project_key, {})[key] = None
+        if assignee_key is not None:
+            tasks_by_assignee.setdefault(assignee_key, {})[key] = None
+            user_response_cache.pop(assignee_key, None)
+        open_tasks_by_project.setdefault(project_key, {})[key] = None
+        project_response_cache.pop(project_key, None)
+        return row
     
     @staticmethod
-    def update(task_id: UUID, task_data: dict) -> Optional[Task]:
-        if task_id not in task_DB:
+    def update(task_id: UUID, task_data: dict) -> Optional[_TaskRow]:
+        key = _k(task_id)
+        task = task_DB.get(key)
+        if task is None:
             return None
         
-        task = task_DB[task_id]
-        for key, value in task_data.items():
-            if hasattr(task, key):
-                setattr(task, key, value)
+        # TaskUpdateDTO пропускает null для title / completed, а в Task они не nullable.
+        # Поля пишутся без повторной валидации, поэтому такой null просто игнорируем
+        task_data = {
+            name: value for name, value in task_data.items()
+            if value is not None or name not in ("title", "completed")
+        }
+        
+        if "assignee_id" in task_data:
+            old_key = _k(task.assignee_id) if task.assignee_id else None
+            new_key = _k(task_data["assignee_id"]) if task_data["assignee_id"] else None
+            if new_key != old_key:
+                if old_key is not None:
+                    tasks_by_assignee.get(old_key, {}).pop(key, None)
+                    user_response_cache.pop(old_key, None)
+                if new_key is not None:
+                    tasks_by_assignee.setdefault(new_key, {})[key] = None
+                    user_response_cache.pop(new_key, None)
+        if "completed" in task_data and bool(task_data["completed"]) != bool(task.completed):
+            project_key = _k(task.project_id)
+            if task_data["completed"]:
+                open_tasks_by_project.get(project_key, {}).pop(key, None)
+                done_tasks_by_project.setdefault(project_key, {})[key] = None
+            else:
+                done_tasks_by_project.get(project_key, {}).pop(key, None)
+                open_tasks_by_project.setdefault(project_key, {})[key] = None
+            project_response_cache.pop(project_key, None)
+        # task_data приходит из TaskUpdateDTO, поля уже провалидированы и есть в _TaskRow
+        for name, value in task_data.items():
+            setattr(task, name, value)
         return task
     
     @staticmethod
     def delete(task_id: UUID) -> bool:
-        if task_id in task_DB:
-            del task_DB[task_id]
-            return True
-        return False
+        key = _k(task_id)
+        task = task_DB.pop(key, None)
+        if task is None:
+            return False
+        project_key = _k(task.project_id)
+        assignee_key = _k(task.assignee_id) if task.assignee_id else None
+        tasks_by_project.get(project_key, {}).pop(key, None)
+        if assignee_key is not None:
+            tasks_by_assignee.get(assignee_key, {}).pop(key, None)
+            user_response_cache.pop(assignee_key, None)
+        if task.completed:
+            done_tasks_by_project.get(project_key, {}).pop(key, None)
+        else:
+            open_tasks_by_project.get(project_key, {}).pop(key, None)
+        project_response_cache.pop(project_key, None)
+        return True
     
 # --------- TaskRepository ---------
 
@@ -194,55 +364,103 @@ class TaskRepository:
 # ------------
 
 # Хелперы / ютилки, чтобы было не так скучно отправлять данные обратно
-
-def enrich_user_data(user: User) -> UserResponseDTO:
-    projects_count = sum(1 for p in project_DB.values() if p.owner_id == user.id)
-    tasks_count = sum(1 for t in task_DB.values() if t.assignee_id == user.id)
+# Данные из репозиториев уже провалидированы, поэтому DTO собираем через model_construct без повторной валидации.
+# Поля строк берём через _row_dict (у slots-строк нет __dict__), а в кеш кладём копию __dict__ готового DTO
+# вместо model_dump(): модели плоские, без computed/вложенных полей, форма та же
+
+def enrich_user_data(user: _UserRow) -> UserResponseDTO:
+    key = _k(user.id)
+    projects_count = len(projects_by_owner.get(key, ()))
+    tasks_count = len(tasks_by_assignee.get(key, ()))
     
-    return UserResponseDTO(
-        **user.model_dump(),
+    return UserResponseDTO.model_construct(
+        **_row_dict(user),
         projects_count=projects_count,
         tasks_count=tasks_count
     )
 
-def enrich_project_data(project: Project) -> ProjectResponseDTO:
-    owner = user_DB.get(project.owner_id)
-    project_tasks = [t for t in task_DB.values() if t.project_id == project.id]
+def enrich_project_data(project: _ProjectRow) -> ProjectResponseDTO:
+    owner = user_DB.get(_k(project.owner_id))
+    key = _k(project.id)
     
-    return ProjectResponseDTO(
-        **project.model_dump(),
+    return ProjectResponseDTO.model_construct(
+        **_row_dict(project),
         owner_username=owner.username if owner else None,
-        tasks_count=len(project_tasks),
-        completed_tasks_count=sum(1 for t in project_tasks if t.completed)
+        tasks_count=len(tasks_by_project.get(key, ())),
+        completed_tasks_count=len(done_tasks_by_project.get(key, ()))
     )
 
-def enrich_task_data(task: Task) -> TaskResponseDTO:
-    project = project_DB.get(task.project_id)
-    assignee = user_DB.get(task.assignee_id) if task.assignee_id else None
+def enrich_task_data(
+    task: _TaskRow,
+    now_ordinal: Optional[int] = None,
+    project_names: Optional[Dict[int, str]] = None,
+    usernames: Optional[Dict[int, str]] = None,
+) -> TaskResponseDTO:
+    project_key = _k(task.project_id)
+    assignee_key = _k(task.assignee_id) if task.assignee_id else None
+    
+    if project_names is not None:
+        project_name = project_names.get(project_key)
+    else:
+        project = project_DB.get(project_key)
+        project_name = project.name if project else None
+    
+    if usernames is not None:
+        assignee_username = usernames.get(assignee_key)
+    else:
+        assignee = user_DB.get(assignee_key) if assignee_key is not None else None
+        assignee_username = assignee.username if assignee else None
     
     days_until_due = None
     if task.due_date:
-        delta = task.due_date - datetime.now()
-        days_until_due = delta.days
+        # Для списков now_ordinal считается один раз на запрос, а не на каждую задачу
+        if now_ordinal is None:
+            now_ordinal = datetime.now().toordinal()
+        days_until_due = task.due_date.toordinal() - now_ordinal
     
-    return TaskResponseDTO(
-        **task.model_dump(),
-        project_name=project.name if project else None,
-        assignee_username=assignee.username if assignee else None,
+    return TaskResponseDTO.model_construct(
+        **_row_dict(task),
+        project_name=project_name,
+        assignee_username=assignee_username,
         days_until_due=days_until_due
     )
 
+# Для списков задач: имена проектов и исполнителей собираем один раз на весь батч
+def build_task_name_maps(tasks: List[_TaskRow]) -> Tuple[Dict[int, str], Dict[int, str]]:
+    project_keys = {_k(t.project_id) for t in tasks}
+    assignee_keys = {_k(t.assignee_id) for t in tasks if t.assignee_id}
+    project_names = {pk: project_DB[pk].name for pk in project_keys if pk in project_DB}
+    usernames = {uk: user_DB[uk].username for uk in assignee_keys if uk in user_DB}
+    return project_names, usernames
+
+# key можно передать, если он уже известен (списки идут по UserRepository.items() / ProjectRepository.items())
+def get_user_response(user: _UserRow, key: Optional[int] = None) -> dict:
+    if key is None:
+        key = _k(user.id)
+    cached = user_response_cache.get(key)
+    if cached is None:
+        cached = user_response_cache[key] = {**enrich_user_data(user).__dict__}
+    return cached
+
+def get_project_response(project: _ProjectRow, key: Optional[int] = None) -> dict:
+    if key is None:
+        key = _k(project.id)
+    cached = project_response_cache.get(key)
+    if cached is None:
+        cached = project_response_cache[key] = {**enrich_project_data(project).__dict__}
+    return cached
+
 # ------------
 
 
 
 # --------- User API ---------
 @app.get("/users", response_model=List[UserResponseDTO])
-def get_all_users():
-    return [enrich_user_data(u) for u in UserRepository.get_all()]
+async def get_all_users():
+    return ORJSONResponse(content=[get_user_response(u, k) for k, u in UserRepository.items()])
 
 @app.post("/users", response_model=UserResponseDTO, status_code=status.HTTP_201_CREATED)
-def create_user(user_data: UserCreateDTO):
+async def create_user(user_data: UserCreateDTO):
 
     # Валидация, проверяем, существует ли пользователь с таким username
     if UserRepository.get_by_username(user_data.username):
@@ -258,19 +476,18 @@ def create_user(user_data: UserCreateDTO):
             detail="Email already exists"
         )
     
-    user = User(**user_data.model_dump())
-    created_user = UserRepository.create(user)
+    created_user = UserRepository.create(user_data)
     return enrich_user_data(created_user)
 
 @app.get("/users/{user_id}", response_model=UserResponseDTO)
-def get_user(user_id: UUID):
+async def get_user(user_id: UUID):
     user = UserRepository.get_by_id(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return enrich_user_data(user)
+    return ORJSONResponse(content=get_user_response(user))
 
 @app.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(user_id: UUID):
+async def delete_user(user_id: UUID):
     if not UserRepository.delete(user_id):
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -280,36 +497,37 @@ def delete_user(user_id: UUID):
 
 # --------- Project API ---------
 @app.get("/projects", response_model=List[ProjectResponseDTO])
-def get_all_projects():
-    return [enrich_project_data(p) for p in ProjectRepository.get_all()]
+async def get_all_projects():
+    return ORJSONResponse(content=[get_project_response(p, k) for k, p in ProjectRepository.items()])
 
 @app.post("/projects", response_model=ProjectResponseDTO, status_code=status.HTTP_201_CREATED)
-def create_project(project_data: ProjectCreateDTO):
+async def create_project(project_data: ProjectCreateDTO):
     try:
-        project = Project(**project_data.model_dump())
-        created_project = ProjectRepository.create(project)
+        created_project = ProjectRepository.create(project_data)
         return enrich_project_data(created_project)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.get("/projects/{project_id}", response_model=ProjectResponseDTO)
-def get_project(project_id: UUID):
+async def get_project(project_id: UUID):
     project = ProjectRepository.get_by_id(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return enrich_project_data(project)
+    return ORJSONResponse(content=get_project_response(project))
 
 @app.delete("/projects/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_project(project_id: UUID):
+async def delete_project(project_id: UUID):
     if not ProjectRepository.delete(project_id):
         raise HTTPException(status_code=404, detail="Project not found")
 
 @app.get("/projects/{project_id}/tasks", response_model=List[TaskResponseDTO])
-def get_project_tasks(project_id: UUID):
-    if project_id not in project_DB:
+async def get_project_tasks(project_id: UUID, completed: Optional[bool] = None):
+    if not ProjectRepository.get_by_id(project_id):
         raise HTTPException(status_code=404, detail="Project not found")
-    tasks = [t for t in task_DB.values() if t.project_id == project_id]
-    return [enrich_task_data(t) for t in tasks]
+    tasks = TaskRepository.get_by_project(project_id, completed)
+    now_ord = datetime.now().toordinal()
+    project_names, usernames = build_task_name_maps(tasks)
+    return [enrich_task_data(t, now_ord, project_names, usernames) for t in tasks]
 
 # --------- Project API ---------
 
@@ -317,34 +535,36 @@ def get_project_tasks(project_id: UUID):
 
 # --------- Task API ---------
 @app.get("/tasks", response_model=List[TaskResponseDTO])
-def get_all_tasks():
-    return [enrich_task_data(t) for t in TaskRepository.get_all()]
+async def get_all_tasks():
+    tasks = TaskRepository.get_all()
+    now_ord = datetime.now().toordinal()
+    project_names, usernames = build_task_name_maps(tasks)
+    return [enrich_task_data(t, now_ord, project_names, usernames) for t in tasks]
 
 @app.post("/tasks", response_model=TaskResponseDTO, status_code=status.HTTP_201_CREATED)
-def create_task(task_data: TaskCreateDTO):
+async def create_task(task_data: TaskCreateDTO):
     try:
-        task = Task(**task_data.model_dump())
-        created_task = TaskRepository.create(task)
+        created_task = TaskRepository.create(task_data)
         return enrich_task_data(created_task)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.get("/tasks/{task_id}", response_model=TaskResponseDTO)
-def get_task(task_id: UUID):
+async def get_task(task_id: UUID):
     task = TaskRepository.get_by_id(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return enrich_task_data(task)
 
 @app.patch("/tasks/{task_id}", response_model=TaskResponseDTO)
-def update_task(task_id: UUID, task_data: TaskUpdateDTO):
+async def update_task(task_id: UUID, task_data: TaskUpdateDTO):
     task = TaskRepository.update(task_id, task_data.model_dump(exclude_unset=True))
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return enrich_task_data(task)
 
 @app.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(task_id: UUID):
+async def delete_task(task_id: UUID):
     if not TaskRepository.delete(task_id):
         raise HTTPException(status_code=404, detail="Task not found")
     
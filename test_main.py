@@ -0,0 +1,124 @@
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+# Хелперы
+
+def create_user():
+    name = uuid4().hex[:8]
+    response = client.post("/users", json={"username": name, "email": f"{name}@example.com"})
+    assert response.status_code == 201
+    return response.json()
+
+def create_project(owner_id):
+    response = client.post("/projects", json={"name": uuid4().hex[:8], "owner_id": owner_id})
+    assert response.status_code == 201
+    return response.json()
+
+def create_task(project_id, assignee_id=None, title=None):
+    body = {"title": title or uuid4().hex[:8], "project_id": project_id}
+    if assignee_id:
+        body["assignee_id"] = assignee_id
+    response = client.post("/tasks", json=body)
+    assert response.status_code == 201
+    return response.json()
+
+def assert_consistent():
+    # Индексы и кеши сверяем с пересчётом "в лоб" по полным спискам
+    users = client.get("/users").json()
+    projects = client.get("/projects").json()
+    tasks = client.get("/tasks").json()
+    usernames = {u["id"]: u["username"] for u in users}
+    project_names = {p["id"]: p["name"] for p in projects}
+
+    for user in users:
+        assert user["projects_count"] == sum(1 for p in projects if p["owner_id"] == user["id"])
+        assert user["tasks_count"] == sum(1 for t in tasks if t["assignee_id"] == user["id"])
+        assert client.get(f"/users/{user['id']}").json() == user
+
+    for project in projects:
+        project_tasks = [t for t in tasks if t["project_id"] == project["id"]]
+        assert project["owner_username"] == usernames.get(project["owner_id"])
+        assert project["tasks_count"] == len(project_tasks)
+        assert project["completed_tasks_count"] == sum(1 for t in project_tasks if t["completed"])
+        assert client.get(f"/projects/{project['id']}").json() == project
+
+        url = f"/projects/{project['id']}/tasks"
+        assert [t["id"] for t in client.get(url).json()] == [t["id"] for t in project_tasks]
+        for completed in (True, False):
+            expected = [t["id"] for t in project_tasks if t["completed"] is completed]
+            response = client.get(url, params={"completed": str(completed).lower()})
+            assert [t["id"] for t in response.json()] == expected
+
+    for task in tasks:
+        assert task["project_name"] == project_names.get(task["project_id"])
+        assert task["assignee_username"] == usernames.get(task["assignee_id"])
+
+
+# Тесты
+
+def test_indexes_and_caches_follow_crud():
+    alice, bob = create_user(), create_user()
+    first, second = create_project(alice["id"]), create_project(bob["id"])
+    tasks = [create_task(first["id"], alice["id"]) for _ in range(4)]
+    tasks += [create_task(second["id"]) for _ in range(2)]
+    assert_consistent()
+
+    for task in tasks[::2]:
+        assert client.patch(f"/tasks/{task['id']}", json={"completed": True}).status_code == 200
+    assert_consistent()
+
+    client.patch(f"/tasks/{tasks[0]['id']}", json={"completed": False, "assignee_id": bob["id"]})
+    client.patch(f"/tasks/{tasks[4]['id']}", json={"assignee_id": alice["id"]})
+    client.patch(f"/tasks/{tasks[1]['id']}", json={"assignee_id": None})
+    assert_consistent()
+
+    assert client.delete(f"/tasks/{tasks[2]['id']}").status_code == 204
+    assert client.delete(f"/tasks/{tasks[2]['id']}").status_code == 404
+    assert_consistent()
+
+    assert client.delete(f"/projects/{second['id']}").status_code == 204
+    assert client.get(f"/projects/{second['id']}/tasks").status_code == 404
+    assert_consistent()
+
+    assert client.delete(f"/users/{bob['id']}").status_code == 204
+    assert client.get(f"/users/{bob['id']}").status_code == 404
+    assert_consistent()
+
+def test_project_tasks_keep_creation_order():
+    project = create_project(create_user()["id"])
+    tasks = [create_task(project["id"], title=f"t{i}") for i in range(8)]
+    for i in (5, 1, 3, 7):
+        client.patch(f"/tasks/{tasks[i]['id']}", json={"completed": True})
+    client.patch(f"/tasks/{tasks[3]['id']}", json={"completed": False})
+
+    url = f"/projects/{project['id']}/tasks"
+    assert [t["title"] for t in client.get(url).json()] == [f"t{i}" for i in range(8)]
+    done = client.get(url, params={"completed": "true"}).json()
+    assert [t["title"] for t in done] == ["t1", "t5", "t7"]
+
+def test_patch_ignores_null_for_required_fields():
+    project = create_project(create_user()["id"])
+    task = create_task(project["id"], title="keep")
+
+    response = client.patch(f"/tasks/{task['id']}", json={"title": None, "completed": None})
+    assert response.status_code == 200
+    assert response.json()["title"] == "keep"
+    assert response.json()["completed"] is False
+    assert_consistent()
+
+def test_duplicate_username_and_email_rejected():
+    user = create_user()
+    response = client.post("/users", json={"username": user["username"], "email": "other@example.com"})
+    assert response.status_code == 400
+    response = client.post("/users", json={"username": uuid4().hex[:8], "email": user["email"].upper()})
+    assert response.status_code == 400
+
+    client.delete(f"/users/{user['id']}")
+    response = client.post("/users", json={"username": user["username"], "email": user["email"].upper()})
+    assert response.status_code == 201